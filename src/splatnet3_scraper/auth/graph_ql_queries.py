@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, Final
 
 import requests
 
@@ -10,7 +10,21 @@ from splatnet3_scraper.constants import (
     GRAPHQL_URL,
     SPLATNET_URL,
 )
-from splatnet3_scraper.utils import get_splatnet_hashes, get_splatnet_version
+from splatnet3_scraper.utils import (
+    create_session,
+    get_splatnet_hashes,
+    get_splatnet_version,
+)
+
+# Static parts of the GraphQL query headers. Per-call values are merged in by
+# ``GraphQLQueries.query_header``. This must never be mutated.
+_QUERY_HEADER: Final[dict[str, str]] = {
+    "Content-Type": "application/json",
+    "Accept": "*/*",
+    "Origin": SPLATNET_URL,
+    "X-Requested-With": "com.nintendo.znca",
+    "Accept-Encoding": "gzip, deflate",
+}
 
 
 class GraphQLQueries:
@@ -26,13 +40,14 @@ class GraphQLQueries:
     """
 
     def __init__(self) -> None:
-        """Initializes the GraphQLQueries class. Initializes a requests.Session
-        and stores it in the session attribute. Also gets the hashes for the
-        GraphQL queries and stores them in the hash_map attribute. The hashes
-        are stored in a dictionary where the keys are the names of the queries
-        and the values are the hashes.
+        """Initializes the GraphQLQueries class. Initializes a pooled
+        requests.Session and stores it in the session attribute, so consecutive
+        queries reuse the same connection to SplatNet 3. Also gets the hashes
+        for the GraphQL queries and stores them in the hash_map attribute. The
+        hashes are stored in a dictionary where the keys are the names of the
+        queries and the values are the hashes.
         """
-        self.session = requests.Session()
+        self.session = create_session()
 
     def get_query(self, query_name: str) -> str:
         """Gets a GraphQL query hash given the name of the query.
@@ -97,25 +112,20 @@ class GraphQLQueries:
         if user_agent is None:
             user_agent = DEFAULT_USER_AGENT
 
-        headers = {
+        return {
+            **_QUERY_HEADER,
             "Authorization": f"Bearer {bullet_token}",
             "Accept-Language": language,
             "User-Agent": user_agent,
             "X-Web-View-Ver": get_splatnet_version(),
-            "Content-Type": "application/json",
-            "Accept": "*/*",
-            "Origin": SPLATNET_URL,
-            "X-Requested-With": "com.nintendo.znca",
             "Referer": (
                 f"{SPLATNET_URL}?"
                 f"lang={language}"
                 f"&na_country={language[-2:]}"
                 f"&na_lang={language}"
             ),
-            "Accept-Encoding": "gzip, deflate",
+            **override,
         }
-        headers.update(override)
-        return headers
 
     def query_body_hash(
         self, query_hash: str | bytes, variables: dict[str, Any] = {}
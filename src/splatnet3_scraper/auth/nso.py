@@ -1,12 +1,16 @@
-import base64
 import hashlib
 import logging
 import os
 import re
-from typing import Callable, Literal, TypeAlias, cast
+from typing import Callable, Final, Literal, TypeAlias, cast
 
 import requests
 
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64  # type: ignore[no-redef]
+
 from splatnet3_scraper import __version__
 from splatnet3_scraper.auth.exceptions import (
     FTokenException,
@@ -20,18 +24,84 @@ from splatnet3_scraper.constants import (
     NXAPI_ZNCA_URL,
     SPLATNET_URL,
 )
-from splatnet3_scraper.utils import get_splatnet_version, retry
+from splatnet3_scraper.utils import (
+    create_session,
+    get_splatnet_version,
+    retry,
+)
+
+_sha256 = hashlib.sha256
 
 version_re = re.compile(
-    r"(?<=whats\-new\_\_latest\_\_version\"\>Version)\s+\d+\.\d+\.\d+"
+    rb"whats-new__latest__version\">Version\s+(\d+\.\d+\.\d+)"
 )
 
+# Static parts of the request headers used during the login flow. Per-call
+# values such as the user agent or authorization are merged in by the methods
+# that use them. These must never be mutated.
+_LOGIN_HEADER: Final[dict[str, str]] = {
+    "Host": "accounts.nintendo.com",
+    "Connection": "keep-alive",
+    "Cache-Control": "max-age=0",
+    "Upgrade-Insecure-Requests": "1",
+    "Accept": (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,"
+        "image/webp,image/apng,*/*;q=0.8n"
+    ),
+    "DNT": "1",
+    "Accept-Encoding": "gzip,deflate,br",
+}
+_SESSION_TOKEN_HEADER: Final[dict[str, str]] = {
+    "Accept-Language": "en-US",
+    "Accept": "application/json",
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Content-Length": "540",
+    "Host": "accounts.nintendo.com",
+    "Connection": "Keep-Alive",
+    "Accept-Encoding": "gzip",
+}
+_USER_ACCESS_TOKEN_HEADER: Final[dict[str, str]] = {
+    "Host": "accounts.nintendo.com",
+    "Accept-Encoding": "gzip",
+    "Content-Type": "application/json",
+    "Content-Length": "436",
+    "Accept": "application/json",
+    "Connection": "Keep-Alive",
+    "User-Agent": (
+        "Dalvik/2.1.0 (Linux; U; Android 14; Pixel 7a Build/UQ1A.240105.004)"
+    ),
+}
+_USER_INFO_HEADER: Final[dict[str, str]] = {
+    "User-Agent": "NASDKAPI; Android",
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "Host": "api.accounts.nintendo.com",
+    "Connection": "Keep-Alive",
+    "Accept-Encoding": "gzip",
+}
+
 FToken_Gen: TypeAlias = Callable[
     [str, str, Literal[1] | Literal[2], str, str | None],
     tuple[str, str, str],
 ]
 
 
+def _urlsafe_b64encode_nopad(data: bytes) -> bytes:
+    """Base64url encodes ``data`` and drops the trailing padding. The amount
+    of padding is fully determined by the input length, so it is sliced off
+    directly instead of scanning the encoded output for ``=`` characters.
+
+    Args:
+        data (bytes): The bytes to encode.
+
+    Returns:
+        bytes: The base64url encoded bytes, without padding.
+    """
+    encoded = base64.urlsafe_b64encode(data)
+    padding = -len(data) % 3
+    return encoded[:-padding] if padding else encoded
+
+
 class NSO:
     """The NSO class contains all the logic to proceed through the login flow.
     This class also holds various properties that are used to make requests to
@@ -151,6 +221,8 @@ class NSO:
     @staticmethod
     def new_instance() -> "NSO":
         """Creates a new instance of the NSO class with a new requests session.
+        The session keeps a pool of connections alive so that the TLS
+        handshake is only paid once per host across the login flow.
 
         This is the recommended way to create a new instance of the NSO class,
         as it ensures that the session is a fresh session, however it is not
@@ -160,22 +232,21 @@ class NSO:
         Returns:
             NSO: A new instance of the NSO class.
         """
-        session = requests.Session()
+        session = create_session()
         return NSO(session=session)
 
     @property
     def version(self) -> str:
         """Returns the current version of the NSO app. Necessary to get the
-        session token. If the version has not been obtained yet, it will be
-        obtained and stored. If the version cannot be obtained, a fallback
-        version will be used.
+        session token. The App Store is not scraped for this; the version
+        pinned in ``constants.py`` as ``APP_VERSION_FALLBACK`` is used, so no
+        request is made. Use ``get_version`` to fetch the live version.
 
         Returns:
             str: The current version of the NSO app.
         """
         if self._version is None:
-            # self._version = self.get_version()
-            self._version = "2.10.1"
+            self._version = APP_VERSION_FALLBACK
         return self._version
 
     @retry(times=2, exceptions=ValueError)
@@ -193,13 +264,14 @@ class NSO:
         # TODO: Replace the iOS app store method with a method that does not
         # require scraping a website with scraping protection.
         response = self.session.get(IOS_APP_URL)
-        version = version_re.search(response.text)
+        # Search the raw bytes to skip decoding the whole page to text
+        version = version_re.search(response.content)
         if version is None:
             self.logger.warning(
                 "Failed to get version from app store, using fallback"
             )
             return APP_VERSION_FALLBACK
-        return version.group(0).strip()
+        return version.group(1).decode()
 
     @property
     def state(self) -> bytes:
@@ -224,7 +296,7 @@ class NSO:
             bytes: The auth state, without padding. A random 36 byte string
                 that is base64url encoded.
         """
-        return base64.urlsafe_b64encode(os.urandom(36))
+        return _urlsafe_b64encode_nopad(os.urandom(36))
 
     @property
     def verifier(self) -> bytes:
@@ -250,8 +322,7 @@ class NSO:
         Returns:
             bytes: The code verifier, without padding.
         """
-        verifier_ = base64.urlsafe_b64encode(os.urandom(32))
-        return verifier_.replace(b"=", b"")
+        return _urlsafe_b64encode_nopad(os.urandom(32))
 
     @property
     def session_token(self) -> str:
@@ -284,28 +355,13 @@ class NSO:
             str: The login URL that can be used to obtain the session token.
         """
         # https://dev.to/mathewthe2/intro-to-nintendo-switch-rest-api-2cm7
-        hash_ = hashlib.sha256()
-        hash_.update(self.verifier)
-        challenge = base64.urlsafe_b64encode(hash_.digest()).replace(b"=", b"")
+        challenge = _urlsafe_b64encode_nopad(_sha256(self.verifier).digest())
 
         header = {
-            "Host": "accounts.nintendo.com",
-            "Connection": "keep-alive",
-            "Cache-Control": "max-age=0",
-            "Upgrade-Insecure-Requests": "1",
+            **_LOGIN_HEADER,
             "User-Agent": user_agent
             if user_agent is not None
             else DEFAULT_USER_AGENT,
-            "Accept": (
-                "text/html,"
-                + "application/xhtml+xml,"
-                + "application/xml;q=0.9,"
-                + "image/webp,"
-                + "image/apng,"
-                + "*/*;q=0.8n"
-            ),
-            "DNT": "1",
-            "Accept-Encoding": "gzip,deflate,br",
         }
         params = {
             "state": self.state,
@@ -326,7 +382,8 @@ class NSO:
     def parse_npf_uri(self, uri: str) -> str:
         """Parses the uri returned by the Nintendo login page and extracts the
         session token code. This is used to pass the challenge and verify that
-        the user is who they say they are.
+        the user is who they say they are. The code is located by its key, so
+        the order of the parameters in the uri does not matter.
 
         Args:
             uri (str): The uri returned by the Nintendo login page.
@@ -335,7 +392,9 @@ class NSO:
             str: The session token code. This is *NOT* the session token, but is
                 used to obtain the session token.
         """
-        return uri.split("&")[1][len("session_token_code=") :]
+        _, _, rest = uri.partition("session_token_code=")
+        session_token_code, _, _ = rest.partition("&")
+        return session_token_code
 
     def get_session_token(self, session_token_code: str) -> str:
         """Obtains the session token from the session token code.
@@ -354,14 +413,8 @@ class NSO:
             str: The session token. DO NOT SHARE THIS TOKEN WITH ANYONE.
         """
         header = {
+            **_SESSION_TOKEN_HEADER,
             "User-Agent": f"OnlineLounge/{self.version} NASDKAPI Android",
-            "Accept-Language": "en-US",
-            "Accept": "application/json",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Content-Length": "540",
-            "Host": "accounts.nintendo.com",
-            "Connection": "Keep-Alive",
-            "Accept-Encoding": "gzip",
         }
         params = {
             "client_id": "71b963c1b7b6d119",
@@ -391,18 +444,7 @@ class NSO:
                 ``access_token`` is used to obtain the user's data, while the
                 ``id_token`` is used to obtain the user's gtoken.
         """
-        header = {
-            "Host": "accounts.nintendo.com",
-            "Accept-Encoding": "gzip",
-            "Content-Type": "application/json",
-            "Content-Length": "436",
-            "Accept": "application/json",
-            "Connection": "Keep-Alive",
-            "User-Agent": (
-                "Dalvik/2.1.0 "
-                "(Linux; U; Android 14; Pixel 7a Build/UQ1A.240105.004)"
-            ),
-        }
+        header = _USER_ACCESS_TOKEN_HEADER
         body = {
             "client_id": "71b963c1b7b6d119",
             "session_token": session_token,
@@ -430,13 +472,8 @@ class NSO:
         # Get user information
         url = "https://api.accounts.nintendo.com/2.0.0/users/me"
         header = {
-            "User-Agent": "NASDKAPI; Android",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
+            **_USER_INFO_HEADER,
             "Authorization": f"Bearer {user_access_token}",
-            "Host": "api.accounts.nintendo.com",
-            "Connection": "Keep-Alive",
-            "Accept-Encoding": "gzip",
         }
         response = self.session.get(url, headers=header)
         return response.json()
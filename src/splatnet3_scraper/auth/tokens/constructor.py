@@ -47,9 +47,7 @@ class TokenManagerConstructor:
         """
         if nso is None:
             nso = NSO.new_instance()
-            nso._session_token = session_token
-        else:
-            nso._session_token = session_token
+        nso._session_token = session_token
         manager = TokenManager(
             nso=nso,
             f_token_url=f_token_url,
@@ -17,9 +17,9 @@ class EnvironmentVariablesManager:
 
     def __init__(self) -> None:
         """Initializes the class and sets up the base environment variables."""
-        self.variable_names = {}
-        for token in self.BASE_TOKENS:
-            self.variable_names[token] = ENV_VAR_NAMES[token]
+        self.variable_names = {
+            token: ENV_VAR_NAMES[token] for token in self.BASE_TOKENS
+        }
 
     def token_to_variable(self, token: str) -> str:
         """Given the token name, returns the environment variable name.
@@ -83,9 +83,15 @@ class EnvironmentVariablesManager:
         return os.environ.get(self.token_to_variable(token))
 
     def get_all(self) -> dict[str, str | None]:
-        """Gets all the environment variables.
+        """Gets all the environment variables. The variable names are read
+        straight from the mapping in a single pass rather than being looked up
+        again for every token.
 
         Returns:
             dict[str, str]: The environment variables.
         """
-        return {token: self.get(token) for token in self.variable_names.keys()}
+        environ_get = os.environ.get
+        return {
+            token: environ_get(variable)
+            for token, variable in self.variable_names.items()
+        }
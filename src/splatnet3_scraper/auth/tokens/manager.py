@@ -18,6 +18,8 @@ logger = logging.getLogger(__name__)
 
 
 class ManagerOrigin:
+    __slots__ = ("origin", "data")
+
     def __init__(self, origin: ORIGIN, data: str | None = None) -> None:
         self.origin = origin
         self.data = data
@@ -124,11 +126,10 @@ class TokenManager:
         Raises:
             ValueError: If the token is a string and the name of the token is
                 not provided.
+
+        # noqa: DAR402 ValueError
         """
-        try:
-            new_token = self.keychain.add_token(token, name, timestamp)
-        except ValueError as e:
-            raise e
+        new_token = self.keychain.add_token(token, name, timestamp)
 
         logger.debug("Added token %s to keychain", new_token.name)
         if new_token.name == TOKENS.GTOKEN:
@@ -147,12 +148,10 @@ class TokenManager:
 
         Returns:
             Token: The token that was retrieved.
-        """
-        try:
-            token = self.keychain.get(name, full_token=True)
-        except ValueError as e:
-            raise e
 
+        # noqa: DAR402 ValueError
+        """
+        token = self.keychain.get(name, full_token=True)
         logger.debug("Retrieved token %s from keychain", token.name)
         return token
 
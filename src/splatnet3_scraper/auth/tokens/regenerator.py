@@ -1,8 +1,5 @@
 import logging
 import time
-from typing import cast
-
-import requests
 
 from splatnet3_scraper.auth.exceptions import FTokenException, SplatNetException
 from splatnet3_scraper.auth.graph_ql_queries import queries
@@ -75,13 +72,13 @@ class TokenRegenerator:
         Returns:
             Token: The bullet token that was generated.
         """
+        # Generating a gtoken also populates the NSO user info, so both are
+        # read straight off the NSO object afterwards.
         if nso._user_info is None:
-            gtoken = TokenRegenerator.generate_gtoken(nso, f_token_urls).value
-            user_info = cast(dict[str, str], nso._user_info)
-        else:
-            gtoken = cast(str, nso._gtoken)
-            user_info = nso._user_info
+            TokenRegenerator.generate_gtoken(nso, f_token_urls)
 
+        gtoken, user_info = nso._gtoken, nso._user_info
+        assert gtoken is not None and user_info is not None
         bullet_token = nso.get_bullet_token(gtoken, user_info, user_agent)
         return Token(bullet_token, TOKENS.BULLET_TOKEN, time.time())
 
@@ -121,8 +118,10 @@ class TokenRegenerator:
         """Validates the tokens.
 
         This method will check if the tokens are valid. If they are not valid,
-        it will attempt to regenerate them. The tokens are returned in a
-        dictionary with the token name as the key and the token as the value.
+        it will attempt to regenerate them. If both tokens had to be
+        regenerated, they are returned as-is without sending a test query. The
+        tokens are returned in a dictionary with the token name as the key and
+        the token as the value.
 
         Args:
             gtoken (Token): Gtoken to validate.
@@ -136,16 +135,25 @@ class TokenRegenerator:
             dict[str, Token]: A dictionary containing all the tokens.
         """
         logger.info("Testing tokens")
-        if not gtoken.is_valid:
+        gtoken_is_valid = gtoken.is_valid
+        if not gtoken_is_valid:
             gtoken = TokenRegenerator.generate_gtoken(nso, f_token_urls)
         if not bullet_token.is_valid:
             bullet_token = TokenRegenerator.generate_bullet_token(
                 nso, f_token_urls, user_agent
             )
+            if not gtoken_is_valid:
+                # Both tokens were just issued by Nintendo, and the bullet token
+                # can only be issued for a working gtoken, so the test query
+                # would only add another round trip.
+                return {
+                    TOKENS.GTOKEN: gtoken,
+                    TOKENS.BULLET_TOKEN: bullet_token,
+                }
 
         header = queries.query_header(bullet_token.value, "en-US", user_agent)
 
-        response = requests.post(
+        response = nso.session.post(
             GRAPH_QL_REFERENCE_URL,
             data=queries.query_body("HomeQuery"),
             headers=header,
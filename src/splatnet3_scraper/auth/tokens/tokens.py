@@ -45,7 +45,7 @@ class Token:
             bool: True if the token is valid (not None and not an empty string)
                 False otherwise.
         """
-        return (self.value is not None) and (self.value != "")
+        return bool(self.value)
 
     @property
     def is_expired(self) -> bool:
@@ -58,7 +58,7 @@ class Token:
         Returns:
             bool: True if the token is expired, False otherwise.
         """
-        return self.time_left <= 0
+        return self.expiration <= time.time()
 
     @property
     def time_left(self) -> float:
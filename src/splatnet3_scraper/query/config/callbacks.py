@@ -1,8 +1,3 @@
-import re
-
-delimiter = re.compile(r"\s*\,\s*")
-
-
 # Make sure all callbacks return values, even if they are not transformed.
 def session_token_callback(
     session_token: str | None,
@@ -18,7 +13,7 @@ def f_token_url_callback(f_token_url: str | list[str] | None) -> list[str]:
     elif isinstance(f_token_url, list):
         return f_token_url
     else:
-        return delimiter.split(f_token_url)
+        return [url.strip() for url in f_token_url.split(",")]
 
 
 def f_token_url_save_callback(f_token_url: list[str] | None) -> str:
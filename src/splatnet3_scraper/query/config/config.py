@@ -10,9 +10,43 @@ from splatnet3_scraper.query.config.config_option_handler import (
     ConfigOptionHandler,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 T = TypeVar("T")
 
 
+def _json_loads(data: bytes) -> dict:
+    """Parses JSON bytes, using ``orjson`` if it is installed.
+
+    Args:
+        data (bytes): The JSON document.
+
+    Returns:
+        dict: The parsed JSON document.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: dict) -> bytes:
+    """Serializes a dictionary to indented JSON bytes, using ``orjson`` if it
+    is installed.
+
+    Args:
+        data (dict): The dictionary to serialize.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
 class Config:
     """The Config class is used to load, store, and manage the configuration
     options for the QueryHandler class. The Config class has a number of static
@@ -34,9 +68,11 @@ class Config:
         *,
         token_manager: TokenManager | None = None,
         output_file_path: str | None = None,
+        output_as_json: bool = False,
     ) -> None:
         self._token_manager = token_manager
         self._output_file_path = output_file_path
+        self._output_as_json = output_as_json
 
         self.handler = handler
 
@@ -254,7 +290,13 @@ class Config:
         save_to_file: bool = True,
         prefix: str = "",
     ) -> Config:
-        """Creates a ``Config`` object from a file.
+        """Creates a ``Config`` object from a file. The file can either be an
+        INI file, as written by ``save_to_file``, or a JSON file, as written by
+        ``save_to_file`` with ``as_json=True``. JSON files are detected by their
+        first non-whitespace character being ``{``. Options in a JSON file can
+        be grouped into sections or sit directly at the top level. The format
+        is remembered, so ``save_to_file`` writes the file back in the same
+        format by default.
 
         Args:
             file_path (str): The path to the file to load the config from.
@@ -267,14 +309,47 @@ class Config:
             Config: The ``Config`` object created from the file.
         """
         prefix = prefix or Config.DEFAULT_PREFIX
-        cparse = configparser.ConfigParser()
-        cparse.read(file_path)
         handler = ConfigOptionHandler(prefix=prefix)
-        handler.read_from_configparser(cparse)
-        return Config.from_config_handler(
+        is_json = Config._is_json_file(file_path)
+        if is_json:
+            with open(file_path, "rb") as f:
+                sections = _json_loads(f.read())
+            for key, value in sections.items():
+                if isinstance(value, dict):
+                    handler.read_from_dict(value)
+                else:
+                    # Flat, unsectioned options sit at the top level
+                    handler.read_from_dict({key: value})
+        else:
+            cparse = configparser.ConfigParser()
+            cparse.read(file_path)
+            handler.read_from_configparser(cparse)
+        config = Config.from_config_handler(
             handler,
             output_file_path=file_path if save_to_file else None,
         )
+        # Keep saving in the format the file was loaded in
+        config._output_as_json = is_json
+        return config
+
+    @staticmethod
+    def _is_json_file(file_path: str) -> bool:
+        """Checks whether a config file is a JSON file by peeking at its first
+        non-whitespace character. Missing or unreadable files are treated as
+        INI files, which ``configparser`` silently skips.
+
+        Args:
+            file_path (str): The path to the config file.
+
+        Returns:
+            bool: True if the file looks like a JSON file, False otherwise.
+        """
+        try:
+            with open(file_path, "rb") as f:
+                head = f.read(64)
+        except OSError:
+            return False
+        return head.lstrip()[:1] == b"{"
 
     @staticmethod
     def from_dict(
@@ -297,12 +372,18 @@ class Config:
 
         return Config.from_config_handler(handler)
 
-    def save_to_file(self, file_path: str | None = None) -> None:
+    def save_to_file(
+        self, file_path: str | None = None, *, as_json: bool | None = None
+    ) -> None:
         """Saves the config to a file.
 
         Args:
             file_path (str | None): The path to the file to save the config to.
                 Defaults to None.
+            as_json (bool | None): Whether to save the config as JSON instead
+                of as an INI file. ``from_file`` can read both formats. If None,
+                the format the config was loaded in is used, which is INI unless
+                it was loaded from a JSON file. Defaults to None.
 
         Raises:
             ValueError: If no file path is provided and no output file path is
@@ -311,6 +392,12 @@ class Config:
         file_path = file_path or self._output_file_path
         if file_path is None:
             raise ValueError("No file path provided.")
+        if as_json is None:
+            as_json = self._output_as_json
+        if as_json:
+            with open(file_path, "wb") as f:
+                f.write(_json_dumps(self.handler.save_to_dict()))
+            return
         config = self.handler.save_to_configparser()
         with open(file_path, "w") as f:
             config.write(f)
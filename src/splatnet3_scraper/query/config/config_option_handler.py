@@ -289,6 +289,28 @@ class ConfigOptionHandler:
             except KeyError:
                 self.unknown_options.append((option, value))
 
+    def save_to_dict(self) -> dict[str, dict[str, str]]:
+        """Saves the config to a dictionary of sections, mirroring the layout
+        written by ``save_to_configparser``. This is used to save the config
+        as JSON.
+
+        Returns:
+            dict[str, dict[str, str]]: The config, keyed by section name and
+                then by option name.
+        """
+        config: dict[str, dict[str, str]] = {}
+        for option in self.OPTIONS:
+            if option.value is None:
+                continue
+            section = config.setdefault(option.section, {})
+            if option.save_callback is not None:
+                section[option.name] = option.convert()
+            else:
+                section[option.name] = option.value
+
+        config["unknown"] = dict(self.unknown_options)
+        return config
+
     def save_to_configparser(
         self, config: configparser.ConfigParser | None = None
     ) -> configparser.ConfigParser:
@@ -5,7 +5,11 @@ import hashlib
 import json
 from typing import Any, Callable, Literal, overload
 
-from splatnet3_scraper.utils import delinearize_json, linearize_json
+from splatnet3_scraper.utils import (
+    delinearize_json,
+    linearize_json,
+    linearize_many,
+)
 
 
 class LinearJSON:
@@ -270,11 +274,11 @@ class JSONParser:
         Returns:
             LinearJSON: The LinearJSON object.
         """
-        header, data = linearize_json(self.data[0])
-        out = LinearJSON(header, data)
-        for row in self.data[1:]:
-            header, data = linearize_json(row)
-            out.append(LinearJSON(header, data))
+        groups = linearize_many(self.data)
+        header, rows = groups[0]
+        out = LinearJSON(header, rows)
+        for header, rows in groups[1:]:
+            out.append(LinearJSON(header, rows))
         return out
 
     def remove_columns(self, columns: list[str]) -> None:
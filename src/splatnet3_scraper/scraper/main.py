@@ -180,7 +180,7 @@ class SplatNet_Scraper:
             variable_name = "vsResultId"
 
         _limit = -1 if limit is None else limit
-        self.logger.info(f"Limit set to {_limit}")
+        self.logger.info("Limit set to %s", _limit)
 
         # Get the list of battles
         summary_query = self.__query(query)
@@ -216,11 +216,11 @@ class SplatNet_Scraper:
                 variables = {variable_name: game_id}
                 queue.append(game_id)
 
-        self.logger.info(f"Queue length: {len(queue)}")
+        self.logger.info("Queue length: %d", len(queue))
         if progress_callback is not None:
             progress_callback(0, len(queue))
         for idx, game_id in enumerate(queue):
-            self.logger.info(f"Getting game {idx + 1} of {len(queue)}")
+            self.logger.info("Getting game %d of %d", idx + 1, len(queue))
             variables = {variable_name: game_id}
             detailed_game = self.__query(detail_query, variables)
             out.append(detailed_game)
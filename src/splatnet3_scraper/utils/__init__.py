@@ -10,6 +10,8 @@ from splatnet3_scraper.utils.json_helpers import (
     delinearize_json,
     enumerate_all_paths,
     linearize_json,
+    linearize_many,
     match_partial_path,
 )
 from splatnet3_scraper.utils.retry import retry
+from splatnet3_scraper.utils.session import create_session
@@ -3,15 +3,21 @@ import logging
 import pathlib
 import time
 from functools import lru_cache
-
-import requests
+from typing import Final
 
 from splatnet3_scraper.constants import GRAPH_QL_REFERENCE_URL
+from splatnet3_scraper.utils.session import create_session
 
 fallback_path = (
     pathlib.Path(__file__).parent.parent / "splatnet3_webview_data.json"
 )
 
+_HASH_DATA_TIMEOUT: Final = (3, 5)
+_session = create_session()
+# Last parsed response and its ETag for each URL, so that a refresh after the
+# TTL expires can be answered with a bodyless 304 Not Modified.
+_etag_cache: dict[str, tuple[str, tuple[dict, str]]] = {}
+
 
 @lru_cache()
 def get_hash_data(
@@ -24,7 +30,9 @@ def get_hash_data(
     parses it to get the hashes for the queries. The initial request
     response contains two keys: ``hash_map`` and ``version``. Both of these
     are returned as a tuple, with the first element being the ``hash_map``
-    and the second element being the ``version``.
+    and the second element being the ``version``. The request goes through a
+    shared session, and if the server sent an ETag for the last response it
+    is sent back so an unchanged file is not downloaded again.
 
     Args:
         url (str | None): The URL to get the hash data from. If None, the
@@ -46,8 +54,20 @@ def get_hash_data(
     del ttl_hash
 
     request_url = url or GRAPH_QL_REFERENCE_URL
-    response = requests.get(request_url).json()
-    return response["graphql"]["hash_map"], response["version"]
+    cached = _etag_cache.get(request_url)
+    headers = {"If-None-Match": cached[0]} if cached is not None else {}
+    response = _session.get(
+        request_url, headers=headers, timeout=_HASH_DATA_TIMEOUT
+    )
+    if cached is not None and response.status_code == 304:
+        return cached[1]
+
+    response_json = response.json()
+    hash_data = response_json["graphql"]["hash_map"], response_json["version"]
+    etag = response.headers.get("ETag")
+    if etag:
+        _etag_cache[request_url] = (etag, hash_data)
+    return hash_data
 
 
 def get_ttl_hash(expiry_time_seconds: float = 15 * 60) -> int:
@@ -101,7 +121,7 @@ def get_splatnet_hashes(url: str | None = None) -> dict[str, str]:
         if not hash_data:
             raise ValueError("Hash data is empty")
     except Exception as e:
-        logging.warning(f"Failed to get hash data: {e}")
+        logging.warning("Failed to get hash data: %s", e)
         logging.warning("Using fallback")
         return get_fallback_hash_data()[0]
     return hash_data
@@ -134,7 +154,7 @@ def get_splatnet_version(url: str | None = None) -> str:
         if not hash_data:
             raise ValueError("Hash data is empty")
     except Exception as e:
-        logging.warning(f"Failed to get hash data: {e}")
+        logging.warning("Failed to get hash data: %s", e)
         logging.warning("Using fallback")
         return get_fallback_hash_data()[1]
     return version
@@ -1,9 +1,10 @@
-import re
+from functools import lru_cache
 from typing import Any, TypeAlias, cast
 
 PathType: TypeAlias = str | int | tuple[str | int, ...]
+_SplitKeyType: TypeAlias = tuple[tuple[Any, ...], tuple[str, ...]]
 
-json_splitter_re = re.compile(r"[\;\.]")
+_SPLITTERS = (";", ".")
 
 
 def linearize_json(
@@ -45,28 +46,34 @@ def linearize_json(
         list[Any]: The values of the JSON object. The values are in the same
             order as the keys.
     """
-    keys = []
-    values = []
-
-    for key, value in json_data.items():
-        if isinstance(value, dict):
-            sub_keys, sub_values = linearize_json(value)
-            keys.extend([(key + "." + sub_key) for sub_key in sub_keys])
-            values.extend(sub_values)
-        elif isinstance(value, list):
-            for i, item in enumerate(value):
-                if isinstance(item, dict):
-                    sub_keys, sub_values = linearize_json(item)
-                    keys.extend(
-                        [
-                            (key + ";" + str(i) + "." + sub_key)
-                            for sub_key in sub_keys
-                        ]
-                    )
-                    values.extend(sub_values)
-                else:
-                    keys.append(key + ";" + str(i))
-                    values.append(item)
+    keys: list[str] = []
+    values: list[Any] = []
+
+    # Depth-first walk with an explicit stack instead of recursion. Entries are
+    # (key, value, expand); children are pushed in reverse so they are popped
+    # in their original order. Lists are only expanded one level, non-dict
+    # list items (including nested lists) are kept as values.
+    stack: list[tuple[str, Any, bool]] = [
+        (key, value, True) for key, value in reversed(json_data.items())
+    ]
+    while stack:
+        key, value, expand = stack.pop()
+        if expand and isinstance(value, dict):
+            prefix = f"{key}."
+            stack.extend(
+                (prefix + sub_key, sub_value, True)
+                for sub_key, sub_value in reversed(value.items())
+            )
+        elif expand and isinstance(value, list):
+            # Lists without dicts are all leaves, so they can be emitted in
+            # one go rather than through the stack.
+            if not any(isinstance(item, dict) for item in value):
+                keys.extend([f"{key};{i}" for i in range(len(value))])
+                values.extend(value)
+                continue
+            for i in range(len(value) - 1, -1, -1):
+                item = value[i]
+                stack.append((f"{key};{i}", item, isinstance(item, dict)))
         else:
             keys.append(key)
             values.append(value)
@@ -76,6 +83,130 @@ def linearize_json(
     return out_keys, values
 
 
+def linearize_many(
+    records: list[dict[str, Any]]
+) -> list[tuple[tuple[str, ...], list[list[Any]]]]:
+    """Linearizes a batch of JSON objects, sharing keys between them.
+
+    Each JSON object is linearized with ``linearize_json``, and consecutive
+    objects that produce the same keys are grouped together so the keys are
+    only stored once per group, with one row of values per object. A batch
+    where every object has the same schema produces a single group. For
+    example:
+
+    >>> linearize_many([{"a": 1}, {"a": 2}, {"b": 3}])
+    ... [
+    ...     (("a",), [[1], [2]]),
+    ...     (("b",), [[3]]),
+    ... ]
+
+    Args:
+        records (list[dict[str, Any]]): The JSON objects to linearize.
+
+    Returns:
+        list[tuple[tuple[str, ...], list[list[Any]]]]: The groups of
+            linearized objects, in order. Each group is the shared keys and
+            the values of every object in the group.
+    """
+    groups: list[tuple[tuple[str, ...], list[list[Any]]]] = []
+    current_keys: tuple[str, ...] | None = None
+    for record in records:
+        keys, values = linearize_json(record)
+        if keys != current_keys:
+            current_keys = keys
+            groups.append((keys, []))
+        groups[-1][1].append(values)
+    return groups
+
+
+def _split_key(key: str) -> tuple[list[Any], list[str]]:
+    """Splits a linearized key into its subkeys and the splitters between them.
+
+    The key is scanned once, and every subkey that follows a semicolon is
+    turned into an integer since it is a list index. Keys that only use one
+    kind of separator are split with ``str.split`` instead.
+
+    Args:
+        key (str): The linearized key, in the format "key1.key2;index1.key3".
+
+    Returns:
+        tuple[list[str | int], list[str]]:
+            list[str | int]: The subkeys of the key.
+            list[str]: The splitters between the subkeys.
+    """
+    # Keys with a single kind of separator can be split natively
+    if ";" not in key:
+        subkeys: list[Any] = key.split(".")
+        return subkeys, ["."] * (len(subkeys) - 1)
+    if "." not in key:
+        first, *indices = key.split(";")
+        return [first, *map(int, indices)], [";"] * len(indices)
+
+    subkeys = []
+    splitters: list[str] = []
+    start = 0
+    index_next = False
+    for i, char in enumerate(key):
+        if char in _SPLITTERS:
+            subkey = key[start:i]
+            subkeys.append(int(subkey) if index_next else subkey)
+            splitters.append(char)
+            index_next = char == ";"
+            start = i + 1
+    subkey = key[start:]
+    subkeys.append(int(subkey) if index_next else subkey)
+    return subkeys, splitters
+
+
+@lru_cache(maxsize=256)
+def _delinearize_plan(
+    keys: tuple[str, ...]
+) -> tuple[tuple[int, str, _SplitKeyType | None], ...]:
+    """Works out the order and split form of the keys for delinearization.
+
+    Every row of a table shares the same header, so the plan is cached per
+    header and only computed once. Keys are ordered by depth and then by name,
+    and each entry holds the index of the key, the key itself, and its split
+    form, which is None if the key has no separators. The split form is
+    stored as tuples so the cached plan cannot be changed by its callers.
+
+    Args:
+        keys (tuple[str, ...]): The keys of the JSON object.
+
+    Returns:
+        tuple[tuple[int, str, _SplitKeyType | None], ...]: The plan entries in
+            the order they should be delinearized.
+    """
+    depths = [key.count(".") + key.count(";") for key in keys]
+    order = sorted(range(len(keys)), key=lambda i: (depths[i], keys[i]))
+    plan = []
+    for idx in order:
+        key = keys[idx]
+        split_key: _SplitKeyType | None = None
+        if "." in key or ";" in key:
+            subkeys, splitters = _split_key(key)
+            split_key = (tuple(subkeys), tuple(splitters))
+        plan.append((idx, key, split_key))
+    return tuple(plan)
+
+
+def _set_list_item(data: list, index: int, value: Any) -> None:
+    """Sets an item of a list by index, padding the list with None if it is
+    too short.
+
+    Keys are delinearized by depth rather than by index, and empty objects in
+    lists are never linearized, so list items do not arrive in order.
+
+    Args:
+        data (list): The list to set the item in.
+        index (int): The index to set.
+        value (Any): The value to set.
+    """
+    if index >= len(data):
+        data.extend([None] * (index - len(data) + 1))
+    data[index] = value
+
+
 def delinearize_json(
     keys: list[str] | tuple[str, ...], values: list[Any]
 ) -> dict[str, Any]:
@@ -95,61 +226,59 @@ def delinearize_json(
         values (list[Any]): The values of the JSON object. The values are
             expected to be in the same order as the keys.
 
+    Raises:
+        ValueError: If a key needs a container where a conflicting value has
+            already been placed.
+
     Returns:
         dict[str, Any]: The JSON object created from the keys and values.
     """
-    json_data = {}
+    # Flat objects need no nesting, the keys map straight to the values
+    if not any(("." in key) or (";" in key) for key in keys):
+        return dict(zip(keys, values))
 
-    # Sort the keys by depth
-    depths = [len(json_splitter_re.split(key)) for key in keys]
-    kvd = list(zip(keys, values, depths))
-    kvd = sorted(kvd, key=lambda x: (x[2], x[0]))
-    keys, values, _ = list(zip(*kvd))
+    json_data = {}
 
     # Delinearize
-    for key, value in zip(keys, values):
+    for idx, key, split_key in _delinearize_plan(tuple(keys)):
+        value = values[idx]
         # If the key is split by a period, it's a nested object. If it's split
         # by a semicolon, it's a list. Check which one is first.
-        subkeys = json_splitter_re.split(key)
-        splitters = json_splitter_re.findall(key)
-        if len(subkeys) == 1:
+        if split_key is None:
             json_data[key] = value
             continue
-        # If the key is split by a semicolon, turn the next key value into an
-        # integer
-        for i, splitter in enumerate(splitters):
-            if splitter == ";":
-                subkeys[i + 1] = int(subkeys[i + 1])
-
-        current = json_data
-        for i, splitter in enumerate(splitters):
+        subkeys, splitters = split_key
+
+        # The splitter before a subkey says what kind of container holds it,
+        # a semicolon means a list and a period means a dict. The root is
+        # always a dict.
+        current: Any = json_data
+        parent_is_list = False
+        for subkey, splitter in zip(subkeys, splitters):
             # If the key already exists, move on to the next key
-            if isinstance(current, (list, dict)):
-                chosen_subkey = subkeys[i]
-                if isinstance(current, list):
-                    condition = len(current) > chosen_subkey
-                elif isinstance(current, dict):
-                    condition = chosen_subkey in current
-
-                if condition:
-                    next_obj = current[chosen_subkey]
-                    # Next object might be None as an artifact of header merging
-                    if next_obj is not None:
-                        current = next_obj
-                        continue
-            new_obj: dict | list = {} if (splitter == ".") else []
-
-            # Append or assign the new object to the current object depending
-            # on type.
-            if isinstance(current, list):
-                current.append(new_obj)
-            elif isinstance(current, dict):
-                current[subkeys[i]] = new_obj
-            # Mypy doesn't like that this is dynamically typed, so we have to
-            # ignore it. This is python, not C.
-            current = new_obj  # type: ignore
-        if isinstance(current, list):
-            current.append(value)
+            if parent_is_list:
+                next_obj = current[subkey] if len(current) > subkey else None
+            else:
+                next_obj = current.get(subkey)
+
+            # Next object might be None as an artifact of header merging or of
+            # padding a list
+            if next_obj is None:
+                next_obj = {} if (splitter == ".") else []
+                if parent_is_list:
+                    _set_list_item(current, subkey, next_obj)
+                else:
+                    current[subkey] = next_obj
+            elif not isinstance(next_obj, dict if (splitter == ".") else list):
+                raise ValueError(
+                    f"Cannot delinearize key {key!r}, it conflicts with the "
+                    f"value {next_obj!r} already at one of its parents."
+                )
+            current = next_obj
+            parent_is_list = splitter == ";"
+
+        if parent_is_list:
+            _set_list_item(current, subkeys[-1], value)
         else:
             current[subkeys[-1]] = value
 
@@ -1,4 +1,6 @@
 import logging
+import random
+import time
 from functools import wraps
 from typing import Callable, Literal, ParamSpec, Type, TypeAlias, TypeVar
 
@@ -8,21 +10,69 @@ P = ParamSpec("P")
 Backoff: TypeAlias = Literal["fixed", "exponential", "fibonacci"]
 
 
+def _backoff_delay(
+    attempt: int,
+    base_delay: float,
+    backoff: Backoff = "exponential",
+) -> float:
+    """Calculates how long to wait after a failed attempt.
+
+    Args:
+        attempt (int): The zero-indexed number of the attempt that failed.
+        base_delay (float): The delay after the first failed attempt, in
+            seconds.
+        backoff (Backoff): How the delay grows with each failed attempt.
+            "fixed" always waits ``base_delay``, "exponential" doubles it every
+            attempt, and "fibonacci" scales it by the Fibonacci sequence.
+            Defaults to "exponential".
+
+    Returns:
+        float: The delay in seconds, before any cap or jitter is applied.
+    """
+    if backoff == "fixed":
+        return base_delay
+    if backoff == "exponential":
+        return base_delay * 2**attempt
+    previous, current = 0, 1
+    for _ in range(attempt):
+        previous, current = current, previous + current
+    return base_delay * current
+
+
 def retry(
     times: int,
     exceptions: tuple[Type[Exception], ...] | Type[Exception] = Exception,
     call_on_fail: Callable[[], None] | None = None,
+    base_delay: float = 0.0,
+    max_delay: float = 5.0,
+    jitter: float = 0.0,
+    backoff: Backoff = "exponential",
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Decorator that retries a function a specified number of times if it
     raises a specific exception or tuple of exceptions.
 
+    Between attempts the decorator can wait before retrying, which avoids
+    hammering a rate limited endpoint. The wait is calculated by
+    ``_backoff_delay``, capped at ``max_delay``, and then a random amount of up
+    to ``jitter`` seconds is added so that concurrent clients do not retry in
+    lockstep. By default there is no wait at all.
+
     Args:
         times (int): Max number of times to retry the function before raising
-            the exception.
+            the exception. The function is called at most ``times + 1`` times
+            in total.
         exceptions (tuple[Type[Exception], ...] | Type[Exception]): Exception
             or tuple of exceptions to catch. Defaults to Exception.
         call_on_fail (Callable[[], None] | None): Function to call if the
             function fails. If None, nothing will be called. Defaults to None.
+        base_delay (float): The delay after the first failed attempt, in
+            seconds. If 0, retries happen immediately. Defaults to 0.0.
+        max_delay (float): The maximum delay between attempts, in seconds,
+            before jitter is added. Defaults to 5.0.
+        jitter (float): The maximum random delay to add to each wait, in
+            seconds. Defaults to 0.0.
+        backoff (Backoff): How the delay grows with each failed attempt. See
+            ``_backoff_delay``. Defaults to "exponential".
 
     Returns:
         Callable[[Callable[P, T]], Callable[P, T]]: The decorated function,
@@ -35,16 +85,22 @@ def retry(
             for i in range(times):
                 try:
                     return func(*args, **kwargs)
-                except exceptions:
+                except exceptions as e:
                     logging.warning(
-                        "%s failed on attempt %d of %d, retrying.",
+                        "%s failed on attempt %d of %d with %s, retrying.",
                         func.__name__,
                         i + 1,
                         times + 1,
+                        type(e).__name__,
                     )
                     if call_on_fail is not None:
                         logging.debug("Calling %s...", call_on_fail.__name__)
                         call_on_fail()
+                    if base_delay > 0 or jitter > 0:
+                        delay = min(
+                            max_delay, _backoff_delay(i, base_delay, backoff)
+                        )
+                        time.sleep(delay + random.uniform(0, jitter))
 
             return func(*args, **kwargs)
 
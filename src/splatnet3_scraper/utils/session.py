@@ -0,0 +1,31 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session() -> requests.Session:
+    """Creates a requests session with a pooled adapter mounted.
+
+    Connections are kept alive and reused for every request made through the
+    session, so the TCP and TLS handshakes are only paid once per host.
+    Requests that fail to connect or hit a transient server error (429, 500,
+    502, 503, 504) are retried up to twice with a short backoff, after which
+    the last response is handed back to the caller instead of raising.
+
+    Returns:
+        requests.Session: The new session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
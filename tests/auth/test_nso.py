@@ -1,4 +1,4 @@
-import hashlib
+import base64
 import os
 from unittest.mock import patch
 
@@ -10,8 +10,12 @@ from splatnet3_scraper.auth.exceptions import (
     NintendoException,
     SplatNetException,
 )
-from splatnet3_scraper.auth.nso import NSO
-from splatnet3_scraper.constants import APP_VERSION_FALLBACK, NXAPI_ZNCA_URL
+from splatnet3_scraper.auth.nso import NSO, _urlsafe_b64encode_nopad
+from splatnet3_scraper.constants import (
+    APP_VERSION_FALLBACK,
+    DEFAULT_USER_AGENT,
+    NXAPI_ZNCA_URL,
+)
 from tests.mock import MockResponse
 
 nso_path = "splatnet3_scraper.auth.nso.NSO"
@@ -56,6 +60,8 @@ class TestNSO:
         for key in nso_variables:
             if key == "session":
                 assert isinstance(nso_variables[key], requests.Session)
+                adapter = nso_variables[key].get_adapter("https://test.com")
+                assert adapter.max_retries.total == 2
             elif key == "_f_token_function":
                 assert nso_variables[key] == nso.get_ftoken
             elif key == "logger":
@@ -180,6 +186,12 @@ class TestNSO:
         assert nso.verifier == encoded_str
         assert nso._verifier == encoded_str
 
+    @pytest.mark.parametrize("length", [0, 1, 2, 3, 32, 33, 36])
+    def test_urlsafe_b64encode_nopad(self, length: int):
+        data = os.urandom(length)
+        expected = base64.urlsafe_b64encode(data).replace(b"=", b"")
+        assert _urlsafe_b64encode_nopad(data) == expected
+
     def test_session_token(self):
         nso = NSO.new_instance()
         assert nso._session_token is None
@@ -201,27 +213,43 @@ class TestNSO:
             return b"test_verifier"
 
         class HashlibMock:
-            def update(self, *args, **kwargs):
-                pass
-
             def digest(self, *args, **kwargs):
                 return urand36
 
         def mock_hashlib_sha256(*args, **kwargs):
+            assert args == (b"test_verifier",)
             return HashlibMock()
 
         def mock_get(*args, **kwargs):
+            assert kwargs["headers"]["User-Agent"] == DEFAULT_USER_AGENT
+            assert kwargs["headers"]["Host"] == "accounts.nintendo.com"
             return MockResponse(200, url="https://test.com/")
 
         monkeypatch.setattr(NSO, "generate_new_state", mock_generate_new_state)
         monkeypatch.setattr(
             NSO, "generate_new_verifier", mock_generate_new_verifier
         )
-        monkeypatch.setattr(hashlib, "sha256", mock_hashlib_sha256)
+        monkeypatch.setattr(
+            "splatnet3_scraper.auth.nso._sha256", mock_hashlib_sha256
+        )
         monkeypatch.setattr(requests.Session, "get", mock_get)
         nso = NSO.new_instance()
         assert nso.generate_login_url() == "https://test.com/"
 
+    @pytest.mark.parametrize(
+        "uri",
+        [
+            "npf71b963c1b7b6d119://auth#session_state=test_state"
+            "&session_token_code=test_code&state=test",
+            "npf71b963c1b7b6d119://auth#state=test"
+            "&session_state=test_state&session_token_code=test_code",
+        ],
+        ids=["second", "last"],
+    )
+    def test_parse_npf_uri(self, uri: str):
+        nso = NSO.new_instance()
+        assert nso.parse_npf_uri(uri) == "test_code"
+
     def test_get_session_token(self, monkeypatch: pytest.MonkeyPatch):
         def mock_get(*args, **kwargs):
             return MockResponse(200, json={"session_token": "test"})
@@ -6,7 +6,11 @@ import pytest
 
 from splatnet3_scraper.auth.exceptions import FTokenException
 from splatnet3_scraper.auth.tokens.regenerator import TokenRegenerator
-from splatnet3_scraper.constants import GRAPH_QL_REFERENCE_URL, TOKENS
+from splatnet3_scraper.constants import (
+    DEFAULT_USER_AGENT,
+    GRAPH_QL_REFERENCE_URL,
+    TOKENS,
+)
 
 test_date_str = "2023-01-01 00:00:00"
 base_regen_path = "splatnet3_scraper.auth.tokens.regenerator"
@@ -64,18 +68,27 @@ class TestTokenRegenerator:
         else:
             nso._user_info = None
 
+        def mock_generate_gtoken_call(nso: MagicMock, *args) -> MagicMock:
+            # Mirrors NSO.get_gtoken, which also populates the user info
+            nso._gtoken = "test_gtoken"
+            nso._user_info = {"test": "test"}
+            return test_gtoken
+
         test_gtoken = MagicMock()
         test_gtoken.value = "test_gtoken"
         with (
             patch(regen_path + ".generate_gtoken") as mock_generate_gtoken,
             patch(base_regen_path + ".Token") as mock_token,
         ):
-            mock_generate_gtoken.return_value = test_gtoken
+            mock_generate_gtoken.side_effect = mock_generate_gtoken_call
             nso.get_bullet_token.return_value = "test_bullet_token"
             TokenRegenerator.generate_bullet_token(nso, self.ftokens_url)
 
             if with_gtoken:
                 mock_generate_gtoken.assert_not_called()
+                nso.get_bullet_token.assert_called_once_with(
+                    "test_gtoken", {"test": "test"}, DEFAULT_USER_AGENT
+                )
                 mock_token.assert_called_once_with(
                     "test_bullet_token",
                     TOKENS.BULLET_TOKEN,
@@ -85,6 +98,9 @@ class TestTokenRegenerator:
                 mock_generate_gtoken.assert_called_once_with(
                     nso, self.ftokens_url
                 )
+                nso.get_bullet_token.assert_called_once_with(
+                    "test_gtoken", {"test": "test"}, DEFAULT_USER_AGENT
+                )
                 mock_token.assert_called_once_with(
                     "test_bullet_token",
                     TOKENS.BULLET_TOKEN,
@@ -140,20 +156,19 @@ class TestTokenRegenerator:
         with (
             patch(regen_path + ".generate_gtoken") as mock_gtoken,
             patch(regen_path + ".generate_bullet_token") as mock_bullet,
-            patch(base_regen_path + ".requests") as mock_requests,
             patch(base_regen_path + ".queries") as mock_queries,
             patch(regen_path + ".generate_all_tokens") as mock_all_tokens,
         ):
             mock_gtoken.return_value = gtoken
             mock_bullet.return_value = bullet_token
-            mock_requests.post.return_value = response
+            nso.session.post.return_value = response
 
             if valid_response:
                 response.status_code = 200
             else:
                 response.status_code = 500
 
-            TokenRegenerator.validate_tokens(
+            result = TokenRegenerator.validate_tokens(
                 gtoken,
                 bullet_token,
                 nso,
@@ -172,11 +187,20 @@ class TestTokenRegenerator:
                     nso, self.ftokens_url, "test_user_agent"
                 )
 
+            if not (valid_gtoken or valid_bullet):
+                nso.session.post.assert_not_called()
+                mock_all_tokens.assert_not_called()
+                assert result == {
+                    TOKENS.GTOKEN: gtoken,
+                    TOKENS.BULLET_TOKEN: bullet_token,
+                }
+                return
+
             mock_queries.query_header.assert_called_once_with(
                 bullet_token.value, "en-US", "test_user_agent"
             )
             mock_queries.query_body.assert_called_once_with("HomeQuery")
-            mock_requests.post.assert_called_once_with(
+            nso.session.post.assert_called_once_with(
                 GRAPH_QL_REFERENCE_URL,
                 data=mock_queries.query_body.return_value,
                 headers=mock_queries.query_header.return_value,
@@ -39,8 +39,11 @@ class TestToken:
             frozen_time.tick(10 * 60 + 5)
             assert token.time_left_str == "19m 55.0s"
 
+            assert token.is_expired is False
+
             frozen_time.tick(20 * 60)
             assert token.time_left_str == "Expired"
+            assert token.is_expired is True
 
     @freezegun.freeze_time("2023-01-01 00:00:00")
     def test_repr(self):
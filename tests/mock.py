@@ -5,8 +5,10 @@ class MockResponse:
         text: str = "",
         json: dict = {},
         url: str = "",
+        headers: dict | None = None,
     ) -> None:
         self._status_code = status_code
+        self.headers = headers or {}
         self.status_code_counter = 0
         self._text = text
         self.text_counter = 0
@@ -25,6 +27,11 @@ class MockResponse:
         self.text_counter += 1
         return self._text
 
+    @property
+    def content(self):
+        self.text_counter += 1
+        return self._text.encode()
+
     def json(self):
         self.json_counter += 1
         return self._json
@@ -37,6 +37,10 @@ class TestCallbacks:
                 "f_token_url_1  ,      f_token_url_2",
                 ["f_token_url_1", "f_token_url_2"],
             ),
+            (
+                " f_token_url_1,\tf_token_url_2\n",
+                ["f_token_url_1", "f_token_url_2"],
+            ),
             (["f_token_url"], ["f_token_url"]),
             (None, None),
         ],
@@ -44,6 +48,7 @@ class TestCallbacks:
             "valid",
             "valid comma separated",
             "valid whitespace comma separated",
+            "valid surrounding whitespace",
             "valid list",
             "invalid",
         ],
@@ -371,6 +371,59 @@ class TestConfig:
                 "test_f_token_url1",
             ]
 
+        def test_json_roundtrip(
+            self, valid_with_ftoken_list: str, temp_file: str
+        ) -> None:
+            config = Config.from_file(valid_with_ftoken_list)
+            config.save_to_file(temp_file, as_json=True)
+            with open(temp_file, "r") as f:
+                assert json.load(f)["tokens"]["gtoken"] == "test_gtoken"
+
+            json_config = Config.from_file(temp_file)
+            assert json_config.tokens == config.tokens
+            assert json_config.handler.get_value("country") == "US"
+            assert json_config.handler.get_value("language") == "en-US"
+            assert (
+                json_config.handler.get_value("user_agent") == "test_user_agent"
+            )
+            assert json_config.handler.get_value("f_token_url") == [
+                "test_f_token_url0",
+                "test_f_token_url1",
+            ]
+
+        def test_json_format_is_kept(
+            self, valid_with_ftoken_list: str, temp_file: str
+        ) -> None:
+            Config.from_file(valid_with_ftoken_list).save_to_file(
+                temp_file, as_json=True
+            )
+            config = Config.from_file(temp_file)
+            config.save_to_file()
+            with open(temp_file, "r") as f:
+                assert json.load(f)["tokens"]["gtoken"] == "test_gtoken"
+
+            # INI files stay INI
+            ini_config = Config.from_file(valid_with_ftoken_list)
+            ini_config.save_to_file(temp_file)
+            assert not Config._is_json_file(temp_file)
+
+        def test_json_flat_options(self, temp_file: str) -> None:
+            with open(temp_file, "w") as f:
+                json.dump(
+                    {
+                        "session_token": "test_session_token",
+                        "gtoken": "test_gtoken",
+                        "bullet_token": "test_bullet_token",
+                        "options": {"language": "en-US"},
+                    },
+                    f,
+                )
+            config = Config.from_file(temp_file)
+            assert config.session_token == "test_session_token"
+            assert config.gtoken == "test_gtoken"
+            assert config.bullet_token == "test_bullet_token"
+            assert config.handler.get_value("language") == "en-US"
+
         def test_s3s_config(self, s3s_config: str) -> None:
             config = Config.from_s3s_config(
                 s3s_config,
@@ -287,3 +287,13 @@ class TestConfigOptionHandler:
             f1_lines = f1.readlines().sort()
             f2_lines = f2.readlines().sort()
             assert f1_lines == f2_lines
+
+    def test_save_to_dict(self, all_config: configparser.ConfigParser) -> None:
+        handler = ConfigOptionHandler()
+        handler.read_from_configparser(all_config)
+        expected = handler.save_to_configparser()
+        config = handler.save_to_dict()
+        assert config == {
+            section: dict(expected.items(section, raw=True))
+            for section in expected.sections()
+        }
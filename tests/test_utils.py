@@ -9,6 +9,7 @@ from pytest_lazyfixture import lazy_fixture
 
 from splatnet3_scraper.constants import GRAPH_QL_REFERENCE_URL
 from splatnet3_scraper.utils import (
+    create_session,
     delinearize_json,
     enumerate_all_paths,
     fallback_path,
@@ -18,9 +19,15 @@ from splatnet3_scraper.utils import (
     get_splatnet_version,
     get_ttl_hash,
     linearize_json,
+    linearize_many,
     match_partial_path,
     retry,
 )
+from splatnet3_scraper.utils.json_helpers import (
+    _delinearize_plan,
+    _split_key,
+)
+from splatnet3_scraper.utils.retry import _backoff_delay
 from tests.mock import MockResponse
 
 utils_path = "splatnet3_scraper.utils"
@@ -106,6 +113,58 @@ class TestRetry:
         assert mock_logger.call_count == 1
         assert count == 2
 
+    @mock.patch("time.sleep")
+    @mock.patch("logging.warning")
+    def test_backoff(
+        self, mock_logger: mock.MagicMock, mock_sleep: mock.MagicMock
+    ):
+        @retry(times=3, base_delay=1.0, max_delay=3.0)
+        def test_func():
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            test_func()
+
+        assert mock_logger.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0, 3.0]
+
+    @mock.patch("time.sleep")
+    @mock.patch("logging.warning")
+    def test_no_backoff(
+        self, mock_logger: mock.MagicMock, mock_sleep: mock.MagicMock
+    ):
+        @retry(times=1)
+        def test_func():
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            test_func()
+
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "backoff, expected",
+        [
+            ("fixed", [1.0, 1.0, 1.0, 1.0, 1.0]),
+            ("exponential", [1.0, 2.0, 4.0, 8.0, 16.0]),
+            ("fibonacci", [1.0, 1.0, 2.0, 3.0, 5.0]),
+        ],
+    )
+    def test_backoff_delay(self, backoff, expected):
+        assert [_backoff_delay(i, 1.0, backoff) for i in range(5)] == expected
+
+
+class TestCreateSession:
+    def test_create_session(self):
+        session = create_session()
+        assert isinstance(session, requests.Session)
+        for prefix in ("https://", "http://"):
+            adapter = session.get_adapter(prefix + "test.com")
+            assert adapter is session.adapters[prefix]
+            assert adapter.max_retries.total == 2
+            assert adapter.max_retries.raise_on_status is False
+            assert 503 in adapter.max_retries.status_forcelist
+
 
 class TestLinearizeJSON:
     @pytest.mark.parametrize(
@@ -145,6 +204,18 @@ class TestLinearizeJSON:
         assert linearize_json(input) == expected
 
 
+class TestLinearizeMany:
+    def test_linearize_many(self):
+        records = [{"a": 1, "b": [2]}, {"a": 3, "b": [4]}, {"c": 5}]
+        assert linearize_many(records) == [
+            (("a", "b;0"), [[1, 2], [3, 4]]),
+            (("c",), [[5]]),
+        ]
+
+    def test_linearize_many_empty(self):
+        assert linearize_many([]) == []
+
+
 class TestDelinearizeJSON:
     @pytest.mark.parametrize(
         "input, expected",
@@ -187,6 +258,52 @@ class TestDelinearizeJSON:
     def test_delinearize_json(self, input, expected):
         assert delinearize_json(*input) == expected
 
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"a": [{"b": 2}, 1]},
+            {"a": [1, {"b": 2}, [3, 4], {"c": {"d": 5}}]},
+            {"a": list(range(12))},
+        ],
+        ids=["dict_then_scalar", "mixed", "long"],
+    )
+    def test_round_trip_lists(self, data):
+        assert delinearize_json(*linearize_json(data)) == data
+
+    def test_conflicting_keys(self):
+        with pytest.raises(ValueError, match="a;0.b"):
+            delinearize_json(["a;0", "a;0.b"], [1, 2])
+
+    def test_plan_is_shared(self):
+        keys = ["a", "b.c", "b.d;0"]
+        assert delinearize_json(keys, [1, 2, 3]) == {
+            "a": 1,
+            "b": {"c": 2, "d": [3]},
+        }
+        assert delinearize_json(keys, [4, 5, 6]) == {
+            "a": 4,
+            "b": {"c": 5, "d": [6]},
+        }
+        assert _delinearize_plan(tuple(keys))[1] == (
+            1,
+            "b.c",
+            (("b", "c"), (".",)),
+        )
+
+
+class TestSplitKey:
+    @pytest.mark.parametrize(
+        "key, expected",
+        [
+            ("a.b.c", (["a", "b", "c"], [".", "."])),
+            ("a;0;1", (["a", 0, 1], [";", ";"])),
+            ("a;0.b;1", (["a", 0, "b", 1], [";", ".", ";"])),
+        ],
+        ids=["dots", "semicolons", "mixed"],
+    )
+    def test_split_key(self, key, expected):
+        assert _split_key(key) == expected
+
 
 class TestEnumerateAllPaths:
     @pytest.mark.parametrize(
@@ -288,16 +405,43 @@ class TestHash:
         ],
     )
     def test_get_hash_data_explicit(self, args: tuple, expected_url: str):
-        with mock.patch.object(
-            requests,
-            "get",
-            return_value=MockResponse(200, json=self.TEST_RESPONSE_JSON),
-        ) as mock_get:
+        with (
+            mock.patch(
+                utils_path + ".hash_data._session.get",
+                return_value=MockResponse(200, json=self.TEST_RESPONSE_JSON),
+            ) as mock_get,
+            mock.patch.dict(utils_path + ".hash_data._etag_cache", clear=True),
+        ):
             assert get_hash_data(*args) == (
                 self.TEST_HASH_MAP,
                 self.TEST_VERSION,
             )
-            mock_get.assert_called_once_with(expected_url)
+            mock_get.assert_called_once_with(
+                expected_url, headers={}, timeout=(3, 5)
+            )
+
+    def test_get_hash_data_not_modified(self):
+        url = "test_etag_url"
+        with (
+            mock.patch(
+                utils_path + ".hash_data._session.get",
+                side_effect=[
+                    MockResponse(
+                        200,
+                        json=self.TEST_RESPONSE_JSON,
+                        headers={"ETag": "test_etag"},
+                    ),
+                    MockResponse(304),
+                ],
+            ) as mock_get,
+            mock.patch.dict(utils_path + ".hash_data._etag_cache", clear=True),
+        ):
+            expected = (self.TEST_HASH_MAP, self.TEST_VERSION)
+            assert get_hash_data(url, 0) == expected
+            assert get_hash_data(url, 1) == expected
+            mock_get.assert_called_with(
+                url, headers={"If-None-Match": "test_etag"}, timeout=(3, 5)
+            )
 
     def test_get_ttl_hash(self):
         with freezegun.freeze_time(self.FROZEN_TIME) as frozen_datetime: